@@ -5,7 +5,7 @@ This script automates the process of scraping roster information from the DPW Mi
 logs the data, and sends SMS notifications based on the roster details.
 
 Features:
-- Scrapes roster data using Selenium WebDriver.
+- Scrapes roster data from the portal over a persistent HTTP session.
 - Logs events and errors with structured data.
 - Sends SMS notifications via ClickSend API.
 - Supports retry mechanisms for unfinalized rosters.
@@ -14,51 +14,128 @@ Usage:
     python3 roster_scraper.py --date YYYY-MM-DD
 
 Dependencies:
-    - selenium
+    - requests
     - clicksend-client
     - beautifulsoup4
+    - lxml
+    - orjson
     - argparse
     - other standard Python libraries
 """
 
 import argparse
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from config import (
     MUM_SEND_DAYS, RECIPIENTS, USERNAME, PASSWORD,
     CLICKSEND_USERNAME, CLICKSEND_PASSWORD
 )
 from offsets import month_offsets
-import clicksend_client
-from my_clicksend_client import SmsMessage
-from clicksend_client.rest import ApiException
 import json
+import orjson
+import re
 import time
 import sys
 import os
+import functools
 import requests
 from bs4 import BeautifulSoup
+from urllib.parse import urljoin
 
-def log_message(data: dict) -> None:
+PORTAL_URL = "https://dpw.portal.tambla.net/Microster.SelfService/Default.aspx"
+
+def setup_session() -> requests.Session:
+    """
+    Configures an HTTP session for the DPW Microster.
+
+    The session keeps cookies and pooled keep-alive connections, and asks for compressed HTML
+    only, since the scraper never needs the portal's images, stylesheets or scripts.
+
+    Returns:
+        requests.Session: A session with the portal request headers set.
+    """
+    new_session = requests.Session()
+    new_session.headers.update({
+        "Accept": "text/html,application/xhtml+xml",
+        "Accept-Encoding": "gzip, deflate",
+        "User-Agent": "Mozilla/5.0 (X11; Linux x86_64) DPW-Roster-Scraper"
+    })
+    return new_session
+
+# A single HTTP session keeps the portal's cookies and connections alive across retries
+session = setup_session()
+
+# Portal session cookies are cached here so repeated runs can skip the login form
+SESSION_CACHE_FILE = os.path.expanduser("~/.cache/dpw_session.json")
+SESSION_CACHE_LIFETIME = 20 * 60  # Seconds; matches the default ASP.NET session timeout
+
+# Matches a shift line such as "D0600-1400 (8)": shift type, start time, end time and hours
+SHIFT_RE = re.compile(r'^(\S)\s*(\d{1,4})\s*-\s*(\d{1,4})\s*\(\s*(\d+)\s*\)$')
+
+@dataclass(slots=True)
+class ShiftLog:
+    """
+    A structured log record describing one script event, such as an SMS being sent.
+
+    Slotted so each record is smaller and cheaper to build than the equivalent dict.
+    """
+    time: str  # ISO 8601 UTC timestamp
+    level: str
+    event: str
+    sms_content: str
+    day: str = ""
+    date: str = ""  # YYYY-MM-DD of the roster date, if any
+    shift_start: int = 0
+    shift_end: int = 0
+    hours: int = 0
+    retry_attempts: int = 0
+
+# Weekday numbers (Monday is 0) for the MUM_SEND_DAYS abbreviations; unrecognised names are ignored
+WEEKDAY_NUMBERS = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
+MUM_SEND_WEEKDAYS = frozenset(
+    WEEKDAY_NUMBERS[day.strip().lower()] for day in MUM_SEND_DAYS if day.strip().lower() in WEEKDAY_NUMBERS
+)
+
+_sms_api = None  # ClickSend SMS API client, created on first use by _get_sms_api
+
+# Named --date values, resolved without parsing a date string
+RELATIVE_DATES = {
+    'today': lambda now: now.date(),
+    'tomorrow': lambda now: now.date() + timedelta(days=1)
+}
+
+def log_message(data: ShiftLog) -> None:
     """
     Logs a structured message by printing it as JSON.
 
     Args:
-        data (dict): A dictionary containing log information with keys such as 'time', 'level',
-                     'event', 'sms_content', 'day', 'date', 'shift_start', 'shift_end',
-                     'hours', and 'retry_attempts'.
+        data (ShiftLog): The log record to write.
 
     Returns:
         None
     """
-    # Print the log as JSON
-    print(json.dumps(data))
+    # Print the log as JSON (orjson serialises dataclasses natively); written to the same
+    # stdout stream as print() so output stays in order
+    sys.stdout.write(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE).decode())
+
+def _get_sms_api():
+    """
+    Returns the shared ClickSend SMS API client, creating it on first use.
+
+    Reusing one client keeps its connection pool, so an error SMS sent after the roster SMS
+    does not set up a new connection.
+
+    Returns:
+        clicksend_client.SMSApi: The SMS API client authenticated with the ClickSend credentials.
+    """
+    global _sms_api
+    if _sms_api is None:
+        import clicksend_client
+        configuration = clicksend_client.Configuration()
+        configuration.username = CLICKSEND_USERNAME
+        configuration.password = CLICKSEND_PASSWORD
+        _sms_api = clicksend_client.SMSApi(clicksend_client.ApiClient(configuration))
+    return _sms_api
 
 def send_sms(message: str, recipients: list) -> None:
     """
@@ -75,25 +152,28 @@ def send_sms(message: str, recipients: list) -> None:
         ApiException: If the ClickSend API encounters an error.
         Exception: For any unexpected errors during the SMS sending process.
     """
+    # Imported here so runs that never send an SMS (e.g. --help) skip loading the ClickSend client.
+    # A missing install is reported like any other send failure, so callers such as the error
+    # handler in main() still go on to log
+    try:
+        from clicksend_client import SmsMessageCollection
+        from my_clicksend_client import SmsMessage
+        from clicksend_client.rest import ApiException
+    except ImportError as e:
+        print(f"Unable to load the ClickSend client, SMS not sent: {e}")
+        return
+
     try:
         print(f"Attempting to send SMS: {message}")
-        configuration = clicksend_client.Configuration()
-        configuration.username = CLICKSEND_USERNAME
-        configuration.password = CLICKSEND_PASSWORD
-        api_instance = clicksend_client.SMSApi(clicksend_client.ApiClient(configuration))
+        api_instance = _get_sms_api()
         business_name = "DP WORLD"  # Ensure this is a valid sender ID
 
-        sms_messages = []
-        for recipient in recipients:
-            sms_message = SmsMessage(
-                source="python",
-                body=message,
-                to=recipient,
-                _from=business_name
-            )
-            sms_messages.append(sms_message)
+        sms_messages = [
+            SmsMessage(source="python", body=message, to=recipient, _from=business_name)
+            for recipient in recipients
+        ]
 
-        sms_message_collection = clicksend_client.SmsMessageCollection(messages=sms_messages)
+        sms_message_collection = SmsMessageCollection(messages=sms_messages)
         print("Sending SMS via ClickSend API...")
         api_response = api_instance.sms_send_post(sms_message_collection)
         print(f"SMS sent successfully: {api_response}")
@@ -102,130 +182,489 @@ def send_sms(message: str, recipients: list) -> None:
     except Exception as e:
         print(f"Unexpected error when sending SMS: {e}")
 
-def setup_webdriver() -> webdriver.Chrome:
+def get_hidden_fields(soup: BeautifulSoup) -> dict:
     """
-    Configures and initializes a headless Selenium WebDriver instance for Chrome.
+    Extracts the ASP.NET hidden form fields required to post back to the portal.
+
+    Args:
+        soup (BeautifulSoup): The parsed HTML of the current portal page.
 
     Returns:
-        webdriver.Chrome: An instance of Chrome WebDriver with specified options.
+        dict: A dictionary mapping '__VIEWSTATE', '__VIEWSTATEGENERATOR' and '__EVENTVALIDATION'
+              to their values. Fields missing from the page are omitted.
+    """
+    hidden_fields = {}
+    for field_id in ("__VIEWSTATE", "__VIEWSTATEGENERATOR", "__EVENTVALIDATION"):
+        field = soup.find('input', id=field_id)
+        if field is not None:
+            hidden_fields[field_id] = field.get('value', '')
+    return hidden_fields
+
+def get_form_action(soup: BeautifulSoup, page_url: str) -> str:
+    """
+    Resolves the URL the ASP.NET form on the page posts back to.
+
+    Args:
+        soup (BeautifulSoup): The parsed HTML of the current portal page.
+        page_url (str): The URL the page was loaded from.
+
+    Returns:
+        str: The absolute URL of the form action, or page_url if the page has no form.
+    """
+    form = soup.find('form')
+    if form is None or not form.get('action'):
+        return page_url
+    return urljoin(page_url, form['action'])
+
+def asp_postback(soup: BeautifulSoup, page_url: str, event_target: str, extra_fields: dict = None,
+                 timeout: float = 30) -> requests.Response:
+    """
+    Posts the ASP.NET form on a portal page back to the server.
+
+    The page's view state and event validation fields are sent along with the event target,
+    as the browser would when a control on the page is used.
+
+    Args:
+        soup (BeautifulSoup): The parsed HTML of the current portal page.
+        page_url (str): The URL the page was loaded from.
+        event_target (str): The control name that raised the postback, or '' for a plain submit.
+        extra_fields (dict, optional): Additional form fields to send, such as credentials.
+        timeout (float, optional): Seconds to wait for the portal to respond. Defaults to 30.
+
+    Returns:
+        requests.Response: The portal's response to the postback.
 
     Raises:
-        selenium.common.exceptions.WebDriverException: If the WebDriver fails to initialize.
+        requests.RequestException: If the request fails at the network level.
+    """
+    form_data = get_hidden_fields(soup)
+    form_data["__EVENTTARGET"] = event_target
+    form_data["__EVENTARGUMENT"] = ""
+    if extra_fields:
+        form_data.update(extra_fields)
+    return session.post(get_form_action(soup, page_url), data=form_data, timeout=timeout)
+
+def parse_roster_page(response: requests.Response):
+    """
+    Parses a portal response if it is the main roster page.
+
+    The parsed page is returned so callers can read the calendar without parsing it again.
+
+    Args:
+        response (requests.Response): The response returned by the portal.
+
+    Returns:
+        BeautifulSoup: The parsed roster page, if the response loaded successfully and contains
+                       the calendar month label.
+        None: If the response is not the main roster page.
+    """
+    if not response.ok:
+        return None
+    soup = BeautifulSoup(response.text, 'lxml')
+    if soup.find(id="ctl00_ContentPlaceHolder1_calendar_lblCurrentMonth") is None:
+        return None
+    return soup
+
+def login() -> tuple:
+    """
+    Logs in to the DPW Microster with the configured credentials.
+
+    Returns:
+        tuple: The parsed main roster page and the URL it was loaded from.
+
+    Raises:
+        SystemExit: If the login form cannot be found or the login fails.
+        requests.RequestException: If a request fails at the network level.
+    """
+    # Navigate to the website
+    print("Navigating to the login page...")
+    response = session.get(PORTAL_URL, timeout=30)
+    response.raise_for_status()
+    login_soup = BeautifulSoup(response.text, 'lxml')
+    print("Login page loaded.")
+
+    # Locate the username and password fields on the login form
+    username_field = login_soup.find('input', id="ctl00_ContentPlaceHolder1_txtPersonnelId")
+    if username_field is None:
+        print("Error: Username field not found on the login page.")
+        sys.exit(1)  # Exit the script if username field is not found
+    password_field = login_soup.find('input', id="ctl00_ContentPlaceHolder1_txtPassword")
+    if password_field is None:
+        print("Error: Password field not found on the login page.")
+        sys.exit(1)  # Exit the script if password field is not found
+
+    # Submit the login form along with the ASP.NET view state
+    login_data = {
+        username_field['name']: USERNAME,
+        password_field['name']: PASSWORD
+    }
+    submit_button = login_soup.find('input', type='submit')
+    if submit_button is not None and submit_button.get('name'):
+        login_data[submit_button['name']] = submit_button.get('value', '')
+    response = asp_postback(login_soup, response.url, "", login_data)
+    print("Entered credentials and submitted the login form.")
+
+    # Check that the main roster page loaded by looking for a specific element
+    print("Checking that the main roster page loaded...")
+    roster_soup = parse_roster_page(response)
+    if roster_soup is None:
+        print("Error: Login failed or main roster page did not load.")
+        sys.exit(1)  # Exit the script if main roster page does not load
+    print("Login successful, main roster page loaded.")
+    save_session(response.url)
+    return roster_soup, response.url
+
+def save_session(roster_url: str) -> None:
+    """
+    Persists the portal session cookies so later runs can skip logging in.
+
+    The cookies are written to SESSION_CACHE_FILE together with the roster page URL and an
+    expiry timestamp. Failing to write the cache is reported but otherwise ignored.
+
+    Args:
+        roster_url (str): The URL of the roster page as returned after logging in.
+
+    Returns:
+        None
+    """
+    cache = {
+        "expires": time.time() + SESSION_CACHE_LIFETIME,
+        "roster_url": roster_url,
+        "cookies": [
+            {"name": cookie.name, "value": cookie.value, "domain": cookie.domain, "path": cookie.path}
+            for cookie in session.cookies
+        ]
+    }
+    try:
+        os.makedirs(os.path.dirname(SESSION_CACHE_FILE), exist_ok=True)
+        # The cookies grant access to the portal, so keep the file private to the user. The mode
+        # passed to os.open only applies to a new file, so tighten an existing one as well
+        with os.fdopen(os.open(SESSION_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'w') as cache_file:
+            os.fchmod(cache_file.fileno(), 0o600)
+            json.dump(cache, cache_file)
+        load_session.cache_clear()
+    except OSError as e:
+        print(f"Error saving session cache: {e}")
+
+@functools.lru_cache(maxsize=None)
+def load_session():
+    """
+    Loads the cached portal session written by save_session, if it has not expired.
+
+    Returns:
+        dict: The cached session with 'expires', 'roster_url' and 'cookies' keys.
+        None: If there is no usable cached session, including when the file is malformed,
+              so the caller falls back to a fresh login that rewrites it.
+    """
+    try:
+        with open(SESSION_CACHE_FILE) as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cache, dict):
+        return None
+    expires = cache.get("expires")
+    cookies = cache.get("cookies")
+    if not isinstance(expires, (int, float)) or not isinstance(cache.get("roster_url"), str):
+        return None
+    if not isinstance(cookies, list) or not all(
+        isinstance(cookie, dict)
+        and all(isinstance(cookie.get(key), str) for key in ("name", "value", "domain", "path"))
+        for cookie in cookies
+    ):
+        return None
+    if expires <= time.time():
+        return None
+    return cache
+
+def start_session() -> tuple:
+    """
+    Opens the main roster page, reusing a cached portal session when possible and
+    logging in otherwise.
+
+    Returns:
+        tuple: The parsed main roster page and the URL it was loaded from.
+
+    Raises:
+        SystemExit: If logging in fails.
+        requests.RequestException: If a request fails at the network level.
+    """
+    cache = load_session()
+    if cache is not None:
+        print("Restoring cached portal session...")
+        for cookie in cache["cookies"]:
+            session.cookies.set(cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"])
+        response = session.get(cache["roster_url"], timeout=30)
+        roster_soup = parse_roster_page(response)
+        if roster_soup is not None:
+            print("Cached session is still valid, main roster page loaded.")
+            return roster_soup, response.url
+        print("Cached session has expired. Logging in again...")
+        session.cookies.clear()
+    return login()
+
+def get_date_cell_id(target_date: datetime.date) -> str:
+    """
+    Resolves the element ID of the calendar cell for a date using the month offsets.
+
+    Args:
+        target_date (datetime.date): The date whose calendar cell is required.
+
+    Returns:
+        str: The element ID of the date cell, e.g. 'ctl00_ContentPlaceHolder1_calendar_DateCell12'.
     """
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--disable-gpu")  # Optional: Disable GPU if not needed
-    chrome_options.add_argument("--no-sandbox")   # Optional: Useful for certain environments
-    driver = webdriver.Chrome(options=chrome_options)
-    return driver
+    offset = month_offsets.get(target_date.month, 0)  # Default to 0 if month not found
+    return f"ctl00_ContentPlaceHolder1_calendar_DateCell{offset + target_date.day}"
 
-def process_roster(driver: webdriver.Chrome, wait: WebDriverWait, test_dates: list, calendar_label) -> tuple:
+def get_date_cells(soup: BeautifulSoup) -> dict:
     """
-    Processes the roster for the specified test dates by scraping data from the calendar.
+    Indexes the text of every calendar date cell on the roster page by element ID.
 
     Args:
-        driver (webdriver.Chrome): The Selenium WebDriver instance.
-        wait (WebDriverWait): The WebDriverWait instance for handling dynamic content.
-        test_dates (list): A list of datetime.date objects representing the dates to process.
-        calendar_label: The Selenium WebElement representing the current calendar month label.
+        soup (BeautifulSoup): The parsed roster page.
+
+    Returns:
+        dict: A dictionary mapping date cell IDs to their text content.
+    """
+    return {
+        cell['id']: cell.get_text()
+        for cell in soup.select('[id^="ctl00_ContentPlaceHolder1_calendar_DateCell"]')
+    }
+
+def navigate_to_month(soup: BeautifulSoup, page_url: str, target_month_text: str):
+    """
+    Moves the calendar forward to the target month if it is not already showing.
+
+    Args:
+        soup (BeautifulSoup): The parsed roster page currently displayed.
+        page_url (str): The URL the displayed roster page was loaded from.
+        target_month_text (str): The month to display, formatted like 'October 2024'.
+
+    Returns:
+        tuple: The parsed roster page showing the target month and the URL it was loaded from.
+        None: If the portal did not navigate to the target month, including when the
+              navigation request fails at the network level.
+
+    Raises:
+        None
+    """
+    calendar_label = soup.find(id="ctl00_ContentPlaceHolder1_calendar_lblCurrentMonth")
+    current_month_text = calendar_label.get_text().strip() if calendar_label else ""  # e.g., "September 2024"
+    if current_month_text == target_month_text:
+        return soup, page_url
+
+    print(f"Current month is {current_month_text}. Target month is {target_month_text}. Navigating to next month...")
+    # Post back to the calendar as if the 'Next Month' link had been clicked. The page is small,
+    # so use a short timeout and retry once rather than waiting the full 30 seconds
+    try:
+        try:
+            response = asp_postback(soup, page_url, "ctl00$ContentPlaceHolder1$calendar$lnkNextMonth", timeout=10)
+        except requests.Timeout:
+            print("'Next Month' postback timed out. Retrying once...")
+            response = asp_postback(soup, page_url, "ctl00$ContentPlaceHolder1$calendar$lnkNextMonth", timeout=10)
+    except requests.RequestException as e:
+        print(f"Error: Could not navigate to {target_month_text}: {e}")
+        return None
+    print(f"Posted back 'Next Month'. Checking that {target_month_text} loaded...")
+
+    next_soup = BeautifulSoup(response.text, 'lxml')
+    calendar_label = next_soup.find(id="ctl00_ContentPlaceHolder1_calendar_lblCurrentMonth")
+    if not response.ok or calendar_label is None or target_month_text not in calendar_label.get_text():
+        return None
+    print(f"Successfully navigated to {target_month_text}.")
+    return next_soup, response.url
+
+def load_roster_page(roster_url: str) -> tuple:
+    """
+    Reloads the main roster page on the existing session, logging in again if the session expired.
+
+    Args:
+        roster_url (str): The URL of the roster page as returned after logging in.
+
+    Returns:
+        tuple: The parsed main roster page and the URL it was loaded from.
+
+    Raises:
+        SystemExit: If logging in again fails.
+        requests.RequestException: If a request fails at the network level.
+    """
+    print("Reloading the roster page...")
+    response = session.get(roster_url, timeout=30)
+    roster_soup = parse_roster_page(response)
+    if roster_soup is None:
+        print("Roster page did not load on the existing session. Logging in again...")
+        return login()
+    return roster_soup, response.url
+
+def prepare_dates(test_dates: list) -> list:
+    """
+    Resolves each test date's cell ID, month label and day name before any requests are made.
+
+    Args:
+        test_dates (list): A list of datetime.date objects, in ascending order.
+
+    Returns:
+        list: A list of (target_date, date_cell_id, target_month_text, day_name) tuples,
+              e.g. (date(2024, 10, 12), 'ctl00_ContentPlaceHolder1_calendar_DateCell14',
+              'October 2024', 'Saturday').
+    """
+    return [
+        (target_date, get_date_cell_id(target_date), target_date.strftime("%B %Y"), target_date.strftime('%A'))
+        for target_date in test_dates
+    ]
+
+def fetch_month_cells(soup: BeautifulSoup, page_url: str, prepared_dates: list) -> dict:
+    """
+    Fetches the date cells of every month covered by the test dates in a single pass.
+
+    Months are visited in order by posting back 'Next Month', so each month page is
+    requested at most once and the dates can then be processed without further requests.
+
+    Args:
+        soup (BeautifulSoup): The parsed main roster page.
+        page_url (str): The URL the main roster page was loaded from.
+        prepared_dates (list): The tuples returned by prepare_dates, in ascending date order.
+
+    Returns:
+        dict: A dictionary mapping month labels (e.g. 'October 2024') to the date cells
+              returned by get_date_cells, or to None if the month could not be displayed.
+
+    Raises:
+        None
+    """
+    month_cells = {}
+    for _, _, target_month_text, _ in prepared_dates:
+        if target_month_text in month_cells:
+            continue
+        month_page = navigate_to_month(soup, page_url, target_month_text)
+        if month_page is None:
+            month_cells[target_month_text] = None
+            continue
+        # Keep the displayed month's page (its view state and URL) for later months
+        soup, page_url = month_page
+        month_cells[target_month_text] = get_date_cells(soup)
+    return month_cells
+
+def roster_finalised(month_cells: dict, prepared_dates: list) -> bool:
+    """
+    Checks whether the roster is finalised for every one of the test dates.
+
+    Args:
+        month_cells (dict): The month date cells returned by fetch_month_cells.
+        prepared_dates (list): The tuples returned by prepare_dates for the dates to check.
+
+    Returns:
+        bool: True if no date cell reports 'not finalised', False otherwise or if a month
+              could not be displayed.
+    """
+    for _, date_cell_id, target_month_text, _ in prepared_dates:
+        date_cells = month_cells[target_month_text]
+        if date_cells is None:
+            return False
+        if "not finalised" in date_cells.get(date_cell_id, "").lower():
+            return False
+    return True
+
+def wait_until_finalised(roster_url: str, prepared_dates: list, timeout: float, poll_interval: float):
+    """
+    Waits for the roster to be finalised, returning as soon as it is rather than re-running
+    the whole scrape on every attempt.
+
+    Args:
+        roster_url (str): The URL of the roster page as returned after logging in.
+        prepared_dates (list): The tuples returned by prepare_dates for the dates to check.
+        timeout (float): The maximum number of seconds to wait.
+        poll_interval (float): The number of seconds between checks of the portal.
+
+    Returns:
+        dict: The month date cells of the finalised roster, as returned by fetch_month_cells.
+        None: If the timeout expired first.
+
+    Raises:
+        requests.RequestException: If a request fails at the network level.
+    """
+    deadline = time.monotonic() + timeout
+    attempt = 0
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(poll_interval, remaining))
+        attempt += 1
+        print(f"Checking whether the roster has been finalised (attempt {attempt})...")
+        roster_soup, page_url = load_roster_page(roster_url)
+        month_cells = fetch_month_cells(roster_soup, page_url, prepared_dates)
+        if roster_finalised(month_cells, prepared_dates):
+            print("Roster has been finalised.")
+            return month_cells
+
+def process_roster(month_cells: dict, prepared_dates: list) -> tuple:
+    """
+    Processes the roster for the specified test dates from the scraped calendar cells.
+
+    Args:
+        month_cells (dict): The month date cells returned by fetch_month_cells.
+        prepared_dates (list): The tuples returned by prepare_dates for the dates to process.
 
     Returns:
         tuple: A tuple containing:
             - combined_message (str): The aggregated SMS message content.
             - not_finalised_found (bool): Flag indicating if any roster was not finalized.
-            - calendar_label: The updated calendar_label WebElement after processing.
 
     Raises:
         None
     """
-    combined_message = ""
+    message_parts = []  # Joined once at the end rather than concatenated per date
     not_finalised_found = False
 
-    for target_date in test_dates:
-        print(f"\nProcessing date: {target_date.strftime('%Y-%m-%d')} ({target_date.strftime('%A')})")
+    for target_date, date_cell_id, target_month_text, day_name in prepared_dates:
+        # Format the date once for every message and log entry below
+        date_iso = target_date.isoformat()  # e.g., "2024-10-12"
+        dmy = f"{target_date.day}/{target_date.month}/{target_date.year}"
+        print(f"\nProcessing date: {date_iso} ({day_name})")
 
-        # Determine the current and target month
-        current_month_text = calendar_label.text.strip()  # e.g., "September 2024"
-        target_month_text = target_date.strftime("%B %Y")  # e.g., "October 2024"
+        date_cells = month_cells[target_month_text]
+        if date_cells is None:
+            print(f"Error: Could not navigate to {target_month_text}. Skipping this date.")
+            continue  # Skip to the next date if navigation fails
 
-        # Navigate to the target month if it's different from the current month
-        if current_month_text != target_month_text:
-            print(f"Current month is {current_month_text}. Target month is {target_month_text}. Navigating to next month...")
-            try:
-                # Wait for the 'Next Month' button to be clickable and click it
-                next_month_link = wait.until(
-                    EC.element_to_be_clickable((By.ID, "ctl00_ContentPlaceHolder1_calendar_lnkNextMonth"))
-                )
-                next_month_link.click()
-                print(f"Clicked 'Next Month' link. Waiting for {target_month_text} to load...")
-                
-                # Wait until the calendar updates to the target month
-                wait.until(
-                    EC.text_to_be_present_in_element(
-                        (By.ID, "ctl00_ContentPlaceHolder1_calendar_lblCurrentMonth"), target_month_text
-                    )
-                )
-                print(f"Successfully navigated to {target_month_text}.")
-                
-                # Update the calendar_label to the new month after navigation
-                calendar_label = driver.find_element(By.ID, "ctl00_ContentPlaceHolder1_calendar_lblCurrentMonth")
-            except TimeoutException:
-                print(f"Error: Could not navigate to {target_month_text}. Skipping this date.")
-                continue  # Skip to the next date if navigation fails
-
-        # Calculate the correct cell index using the month offset
-        month = target_date.month
-        day = target_date.day
-        offset = month_offsets.get(month, 0)  # Default to 0 if month not found
-        cell_index = offset + day
-        date_cell_id = f"ctl00_ContentPlaceHolder1_calendar_DateCell{cell_index}"
-        
-        try:
-            print(f"Locating date cell with ID: {date_cell_id}")
-            date_cell = wait.until(
-                EC.presence_of_element_located((By.ID, date_cell_id))
-            )
-            cell_content = date_cell.get_attribute("textContent").strip()
-            print(f"Content of {target_date}: '{cell_content}'")
-        except TimeoutException:
+        print(f"Locating date cell with ID: {date_cell_id}")
+        cell_content = date_cells.get(date_cell_id)
+        if cell_content is None:
             print(f"Error: Date cell {date_cell_id} not found. Skipping this date.")
             continue  # Skip to the next date if date cell is not found
+        cell_content = cell_content.strip()
+        cell_content_lower = cell_content.lower()  # Case-folded once for the status checks below
+        print(f"Content of {target_date}: '{cell_content}'")
+        now_iso = datetime.now(timezone.utc).isoformat()
 
         # Process the cell content
         if not cell_content or cell_content == "&nbsp;":
-            message = f"Not rostered for ({target_date.strftime('%A')}) {target_date.day}/{target_date.month}/{target_date.year}."
-            shift_data = {
-                "time": datetime.now(timezone.utc).isoformat(),
-                "level": "INFO",
-                "event": "SMS_SENT",
-                "sms_content": message,
-                "day": target_date.strftime('%A'),
-                "date": target_date.strftime("%Y-%m-%d"),
-                "shift_start": 0,
-                "shift_end": 0,
-                "hours": 0,
-                "retry_attempts": 0
-            }
+            message = f"Not rostered for ({day_name}) {dmy}."
+            shift_data = ShiftLog(
+                time=now_iso,
+                level="INFO",
+                event="SMS_SENT",
+                sms_content=message,
+                day=day_name,
+                date=date_iso
+            )
             log_message(shift_data)
-            combined_message += message + '\n'
+            message_parts.append(message)
             print(f"Added message: {message}")
-        elif "not finalised" in cell_content.lower():
+        elif "not finalised" in cell_content_lower:
             print(f"Shift for {target_date} not finalised.")
-            message = f"Not finalised for ({target_date.strftime('%A')}) {target_date.day}/{target_date.month}/{target_date.year}."
-            shift_data = {
-                "time": datetime.now(timezone.utc).isoformat(),
-                "level": "WARNING",
-                "event": "SHIFT_NOT_FINALISED",
-                "sms_content": message,
-                "day": target_date.strftime('%A'),
-                "date": target_date.strftime("%Y-%m-%d"),
-                "shift_start": 0,
-                "shift_end": 0,
-                "hours": 0,
-                "retry_attempts": 0
-            }
+            message = f"Not finalised for ({day_name}) {dmy}."
+            shift_data = ShiftLog(
+                time=now_iso,
+                level="WARNING",
+                event="SHIFT_NOT_FINALISED",
+                sms_content=message,
+                day=day_name,
+                date=date_iso
+            )
             log_message(shift_data)
-            combined_message += message + '\n'
+            message_parts.append(message)
             print(f"Added warning message: {message}")
             not_finalised_found = True  # Set the flag to indicate that a retry is needed
             break  # Exit the loop to trigger a retry
@@ -241,17 +680,14 @@ def process_roster(driver: webdriver.Chrome, wait: WebDriverWait, test_dates: li
                     if not line:
                         continue
                     # Example line: "D0600-1400 (8)"
-                    shift_type = line[0]  # 'D'
-                    times_and_hours = line[1:].strip()  # "0600-1400 (8)"
-                    try:
-                        times, hours_str = times_and_hours.split('(')
-                        shift_start_str, shift_end_str = times.split('-')
-                        shift_start = int(shift_start_str.lstrip('0') or '0')  # Convert to integer without leading zeros
-                        shift_end = int(shift_end_str.lstrip('0') or '0')      # Convert to integer without leading zeros
-                        hours = int(hours_str.replace(')', '').strip())        # Cast to integer
-                    except ValueError:
+                    match = SHIFT_RE.match(line)
+                    if not match:
                         print(f"Error parsing line: '{line}'. Skipping this shift.")
                         continue  # Skip this shift if parsing fails
+                    shift_type = match.group(1)       # 'D'
+                    shift_start = int(match.group(2))  # 600
+                    shift_end = int(match.group(3))    # 1400
+                    hours = int(match.group(4))        # 8
                     hours_worked += hours
                     shifts.append({
                         "shift_type": shift_type,
@@ -262,42 +698,38 @@ def process_roster(driver: webdriver.Chrome, wait: WebDriverWait, test_dates: li
                 if not shifts:
                     print(f"No valid shift details found for {target_date}.")
                 # Create the SMS content
-                sms_content = f"Hours for ({target_date.strftime('%A')}) {target_date.day}/{target_date.month}/{target_date.year} are: {cell_content.strip()} (c) Bsecurity"
-                combined_message += sms_content + '\n'
+                sms_content = f"Hours for ({day_name}) {dmy} are: {cell_content} (c) Bsecurity"
+                message_parts.append(sms_content)
                 print(f"Added shift details: {sms_content}")
 
                 # Structuring the data
-                shift_data = {
-                    "time": datetime.now(timezone.utc).isoformat(),
-                    "level": "INFO",
-                    "event": "SMS_SENT",
-                    "sms_content": sms_content,
-                    "day": target_date.strftime('%A'),
-                    "date": target_date.strftime("%Y-%m-%d"),
-                    "shift_start": shifts[0]['shift_start'] if shifts else 0,
-                    "shift_end": shifts[-1]['shift_end'] if shifts else 0,
-                    "hours": hours_worked,
-                    "retry_attempts": 0
-                }
+                shift_data = ShiftLog(
+                    time=now_iso,
+                    level="INFO",
+                    event="SMS_SENT",
+                    sms_content=sms_content,
+                    day=day_name,
+                    date=date_iso,
+                    shift_start=shifts[0]['shift_start'] if shifts else 0,
+                    shift_end=shifts[-1]['shift_end'] if shifts else 0,
+                    hours=hours_worked
+                )
                 log_message(shift_data)
             except Exception as e:
                 print(f"Error processing shift for {target_date}: {e}")
                 # Optionally, log this unexpected error
-                error_data = {
-                    "time": datetime.now(timezone.utc).isoformat(),
-                    "level": "ERROR",
-                    "event": "SHIFT_PROCESSING_ERROR",
-                    "sms_content": f"Error processing shift for {target_date}: {e}",
-                    "day": target_date.strftime('%A'),
-                    "date": target_date.strftime("%Y-%m-%d"),
-                    "shift_start": 0,
-                    "shift_end": 0,
-                    "hours": 0,
-                    "retry_attempts": 0
-                }
+                error_data = ShiftLog(
+                    time=now_iso,
+                    level="ERROR",
+                    event="SHIFT_PROCESSING_ERROR",
+                    sms_content=f"Error processing shift for {target_date}: {e}",
+                    day=day_name,
+                    date=date_iso
+                )
                 log_message(error_data)
 
-    return combined_message, not_finalised_found, calendar_label
+    combined_message = "\n".join(message_parts) + ("\n" if message_parts else "")
+    return combined_message, not_finalised_found
 
 def parse_arguments() -> argparse.Namespace:
     """
@@ -319,12 +751,13 @@ def parse_arguments() -> argparse.Namespace:
     args = parser.parse_args()
     return args
 
-def determine_base_date(date_str: str) -> datetime.date:
+def determine_base_date(date_str: str, now: datetime) -> datetime.date:
     """
     Determines the base date for processing based on the input string.
 
     Args:
         date_str (str): The input date string. Can be 'today', 'tomorrow', or 'YYYY-MM-DD'.
+        now (datetime): The local time the script started, used to resolve 'today' and 'tomorrow'.
 
     Returns:
         datetime.date: The determined base date.
@@ -332,10 +765,9 @@ def determine_base_date(date_str: str) -> datetime.date:
     Raises:
         SystemExit: If the date format is invalid.
     """
-    if date_str.lower() == 'today':
-        base_date = datetime.today().date()
-    elif date_str.lower() == 'tomorrow':
-        base_date = datetime.today().date() + timedelta(days=1)
+    relative_date = RELATIVE_DATES.get(date_str.lower())
+    if relative_date is not None:
+        base_date = relative_date(now)
     else:
         try:
             base_date = datetime.strptime(date_str, '%Y-%m-%d').date()
@@ -376,7 +808,7 @@ def main() -> None:
     """
     The main function that orchestrates the roster scraping and SMS notifications.
 
-    It handles retries for unfinalized rosters and sends SMS notifications based on the processed data.
+    It waits for unfinalized rosters to be finalised and sends SMS notifications based on the processed data.
 
     Returns:
         None
@@ -384,141 +816,85 @@ def main() -> None:
     Raises:
         SystemExit: Exits the script upon encountering critical errors or after reaching retry limits.
     """
+    # Read the clock once; the base date and the send day are both derived from it
+    now = datetime.now()
+
     # Parse command-line arguments
     args = parse_arguments()
-    base_date = determine_base_date(args.date)
+    base_date = determine_base_date(args.date, now)
     print(f"Base date set to: {base_date.strftime('%Y-%m-%d')} ({base_date.strftime('%A')})")
 
     # Determine test_dates based on the base_date
     test_dates = get_test_dates(base_date)
     print(f"Dates to process: {[date.strftime('%Y-%m-%d') for date in test_dates]}")
+    # Resolve cell IDs and labels once; every roster check below reuses them
+    prepared_dates = prepare_dates(test_dates)
 
     max_retries = 120  # Define your maximum number of retries
     retry_delay = 60    # Delay in seconds between retries
-    current_retry = 0
 
-    while current_retry < max_retries:
-        driver = setup_webdriver()
-        wait = WebDriverWait(driver, 30)
+    try:
+        roster_soup, roster_url = start_session()  # Later checks reload roster_url on the same session
+
+        # Fetch every month needed up front, then process the roster from those cells
+        month_cells = fetch_month_cells(roster_soup, roster_url, prepared_dates)
+        combined_message, not_finalised_found = process_roster(month_cells, prepared_dates)
+
+        # Never send a not finalised roster; keep waiting until it is finalised or time runs out
+        deadline = time.monotonic() + max_retries * retry_delay
+        while not_finalised_found:
+            print(f"Roster not finalised. Checking every {retry_delay} seconds for up to {max_retries} attempts...")
+            month_cells = wait_until_finalised(roster_url, prepared_dates, deadline - time.monotonic(), retry_delay)
+            if month_cells is None:
+                print(f"Retry limit ({max_retries}) reached. Could not retrieve finalized information.")
+                # Log the failure
+                message = f"Retry limit ({max_retries}) reached. Could not retrieve finalized roster information."
+                log_data = ShiftLog(
+                    time=datetime.now(timezone.utc).isoformat(),
+                    level="ERROR",
+                    event="RETRY_LIMIT_REACHED",
+                    sms_content=message,
+                    retry_attempts=max_retries
+                )
+                log_message(log_data)
+                # Notify only self and wife about the failure
+                send_sms(message, [RECIPIENTS['self'], RECIPIENTS['wife']])
+                sys.exit(1)  # Exit the script after reaching retry limit
 
-        try:
-            # Navigate to the website
-            print("Navigating to the login page...")
-            driver.get("https://dpw.portal.tambla.net/Microster.SelfService/Default.aspx")
-            print("Login page loaded.")
+            # Process the finalised roster the wait returned, without fetching it again
+            combined_message, not_finalised_found = process_roster(month_cells, prepared_dates)
 
-            # Wait for the username field and enter the username
-            try:
-                print("Waiting for the username field...")
-                username_field = wait.until(
-                    EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_txtPersonnelId"))
-                )
-                username_field.send_keys(USERNAME)
-                print("Entered username.")
-            except TimeoutException:
-                print("Error: Username field not found within the expected time.")
-                driver.quit()
-                sys.exit(1)  # Exit the script if username field is not found
-
-            # Wait for the password field and enter the password
-            try:
-                print("Waiting for the password field...")
-                password_field = wait.until(
-                    EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_txtPassword"))
-                )
-                password_field.send_keys(PASSWORD)
-                password_field.send_keys(Keys.RETURN)
-                print("Entered password and submitted the login form.")
-            except TimeoutException:
-                print("Error: Password field not found within the expected time.")
-                driver.quit()
-                sys.exit(1)  # Exit the script if password field is not found
-
-            # Wait for the main roster page to load by waiting for a specific element
-            try:
-                print("Waiting for the main roster page to load...")
-                calendar_label = wait.until(
-                    EC.presence_of_element_located((By.ID, "ctl00_ContentPlaceHolder1_calendar_lblCurrentMonth"))
-                )
-                print("Login successful, main roster page loaded.")
-            except TimeoutException:
-                print("Error: Login failed or main roster page did not load within the expected time.")
-                driver.quit()
-                sys.exit(1)  # Exit the script if main roster page does not load
-
-            # Process the roster, passing the calendar_label
-            combined_message, not_finalised_found, calendar_label = process_roster(driver, wait, test_dates, calendar_label)
-
-            # Close the WebDriver session as processing is done
-            driver.quit()
-            print("WebDriver session ended.")
-
-            if not_finalised_found:
-                current_retry += 1
-                if current_retry < max_retries:
-                    print(f"Roster not finalised. Retry {current_retry}/{max_retries} in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
-                else:
-                    print(f"Retry limit ({max_retries}) reached. Could not retrieve finalized information.")
-                    # Log the failure
-                    message = f"Retry limit ({max_retries}) reached. Could not retrieve finalized roster information."
-                    log_data = {
-                        "time": datetime.now(timezone.utc).isoformat(),
-                        "level": "ERROR",
-                        "event": "RETRY_LIMIT_REACHED",
-                        "sms_content": message,
-                        "day": "",
-                        "date": "",
-                        "shift_start": 0,
-                        "shift_end": 0,
-                        "hours": 0,
-                        "retry_attempts": current_retry
-                    }
-                    log_message(log_data)
-                    # Notify only self and wife about the failure
-                    send_sms(message, [RECIPIENTS['self'], RECIPIENTS['wife']])
-                    sys.exit(1)  # Exit the script after reaching retry limit
-            else:
-                if combined_message.strip():
-                    # Determine current day
-                    current_day = datetime.today().strftime('%a').lower()  # e.g., 'mon', 'tue'
-                    print(f"Current day: {current_day}")
-
-                    # Always send to self and wife
-                    recipients = [RECIPIENTS['self'], RECIPIENTS['wife']]
-
-                    # Send to mum only on specified days (Wednesday and Thursday)
-                    if current_day in MUM_SEND_DAYS:
-                        recipients.append(RECIPIENTS['mum'])
-
-                    print(f"Sending SMS to: {recipients}")
-                    send_sms(combined_message.strip(), recipients)
-                else:
-                    print("No messages to send.")
-                # Exit the loop as processing is successful
-                break
-
-        except Exception as e:
-            print(f"An unexpected error occurred: {e}")
-            driver.quit()
-            # Optionally, send an SMS or email notification about the failure
-            error_message = f"Script encountered an error: {e}"
-            send_sms(error_message, [RECIPIENTS['self'], RECIPIENTS['wife']])
-            # Log the unexpected error
-            error_data = {
-                "time": datetime.now(timezone.utc).isoformat(),
-                "level": "ERROR",
-                "event": "UNEXPECTED_ERROR",
-                "sms_content": error_message,
-                "day": "",
-                "date": "",
-                "shift_start": 0,
-                "shift_end": 0,
-                "hours": 0,
-                "retry_attempts": current_retry
-            }
-            log_message(error_data)
-            sys.exit(1)  # Exit the script on unexpected errors
+        if combined_message.strip():
+            # Determine current day
+            current_weekday = now.weekday()  # Monday is 0 and Sunday is 6
+            print(f"Current day: {now.strftime('%a').lower()}")  # e.g., 'mon', 'tue'; for the log only
+
+            # Always send to self and wife
+            recipients = [RECIPIENTS['self'], RECIPIENTS['wife']]
+
+            # Send to mum only on specified days (Wednesday and Thursday)
+            if current_weekday in MUM_SEND_WEEKDAYS:
+                recipients.append(RECIPIENTS['mum'])
+
+            print(f"Sending SMS to: {recipients}")
+            send_sms(combined_message.strip(), recipients)
+        else:
+            print("No messages to send.")
+
+    except Exception as e:
+        print(f"An unexpected error occurred: {e}")
+        # Optionally, send an SMS or email notification about the failure
+        error_message = f"Script encountered an error: {e}"
+        send_sms(error_message, [RECIPIENTS['self'], RECIPIENTS['wife']])
+        # Log the unexpected error
+        error_data = ShiftLog(
+            time=datetime.now(timezone.utc).isoformat(),
+            level="ERROR",
+            event="UNEXPECTED_ERROR",
+            sms_content=error_message
+        )
+        log_message(error_data)
+        sys.exit(1)  # Exit the script on unexpected errors
 
     print("Script completed successfully.")
 